@@ -6,6 +6,7 @@ The details of Language Specific configuration are not exposed to the user.
 """
 
 import asyncio
+import atexit
 import dataclasses
 import json
 import time
@@ -53,6 +54,52 @@ class LSPFileBuffer:
     ref_count: int
 
 
+class ThreadSafeEvent:
+    """
+    An asyncio.Event that can be set from any thread. The underlying event is created on the loop passed
+    to `bind`, and `set` schedules it on that loop with call_soon_threadsafe when called from another thread.
+    Setting the event before it is bound is remembered and applied on the next `bind` only; every later
+    `bind` starts with an unset event.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._event: Union[asyncio.Event, None] = None
+        self._set_before_bind = False
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Binds the event to the given loop. Must be called from a coroutine running on that loop.
+        """
+        self._loop = loop
+        self._event = asyncio.Event()
+        if self._set_before_bind:
+            self._event.set()
+            self._set_before_bind = False
+
+    def set(self) -> None:
+        if self._event is None:
+            self._set_before_bind = True
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def is_set(self) -> bool:
+        if self._event is None:
+            return self._set_before_bind
+        return self._event.is_set()
+
+    async def wait(self) -> bool:
+        assert self._event is not None, "ThreadSafeEvent must be bound to a loop before waiting on it"
+        return await self._event.wait()
+
+
 class LanguageServer:
     """
     The LanguageServer class provides a language agnostic interface to the Language Server Protocol.
@@ -135,6 +182,11 @@ class LanguageServer:
         self.repository_root_path: str = repository_root_path
         self.completions_available = asyncio.Event()
 
+        # Set by the language specific subclass once the server has finished indexing the workspace.
+        # start_server does not wait for it; every request_* method waits for it instead.
+        # It is bound to the loop running start_server, as the instance may be created on another thread.
+        self.server_ready = ThreadSafeEvent()
+
         if config.trace_lsp_communication:
 
             def logging_fn(source, target, msg):
@@ -167,6 +219,7 @@ class LanguageServer:
         # LanguageServer has been shutdown
         ```
         """
+        self.server_ready.bind(asyncio.get_running_loop())
         self.server_started = True
         yield self
         self.server_started = False
@@ -359,6 +412,8 @@ class LanguageServer:
             )
             raise MultilspyException("Language Server not started")
 
+        await self.server_ready.wait()
+
         with self.open_file(relative_file_path):
             # sending request to the language server and waiting for response
             response = await self.server.send.definition(
@@ -442,6 +497,8 @@ class LanguageServer:
             )
             raise MultilspyException("Language Server not started")
 
+        await self.server_ready.wait()
+
         with self.open_file(relative_file_path):
             # sending request to the language server and waiting for response
             response = await self.server.send.references(
@@ -484,6 +541,8 @@ class LanguageServer:
 
         :return List[multilspy_types.CompletionItem]: A list of completions
         """
+        await self.server_ready.wait()
+
         with self.open_file(relative_file_path):
             open_file_buffer = self.open_file_buffers[
                 pathlib.Path(os.path.join(self.repository_root_path, relative_file_path)).as_uri()
@@ -574,6 +633,8 @@ class LanguageServer:
 
         :return Tuple[List[multilspy_types.UnifiedSymbolInformation], Union[List[multilspy_types.TreeRepr], None]]: A list of symbols in the file, and the tree representation of the symbols
         """
+        await self.server_ready.wait()
+
         with self.open_file(relative_file_path):
             response = await self.server.send.document_symbol(
                 {
@@ -621,6 +682,8 @@ class LanguageServer:
 
         :return None
         """
+        await self.server_ready.wait()
+
         with self.open_file(relative_file_path):
             response = await self.server.send.hover(
                 {
@@ -648,10 +711,23 @@ class SyncLanguageServer:
     It is used to communicate with Language Servers of different programming languages.
     """
 
+    # Servers created with create_persistent, keyed by (config fields, absolute repository root path)
+    _persistent_servers: Dict[Tuple[tuple, str], "SyncLanguageServer"] = {}
+    # Per-key locks, held while the server for a key is started or closed
+    _persistent_key_locks: Dict[Tuple[tuple, str], threading.Lock] = {}
+    # Guards the two dicts above only, and is never held while a server starts
+    _persistent_servers_lock = threading.Lock()
+
+    # Event loop shared by all instances, running forever in a daemon thread once started by _get_shared_loop
+    _shared_loop: Union[asyncio.AbstractEventLoop, None] = None
+    _shared_loop_lock = threading.Lock()
+
     def __init__(self, language_server: LanguageServer) -> None:
         self.language_server = language_server
         self.loop = None
         self.loop_thread = None
+        self.persistent = False
+        self._persistent_ctx = None
 
     @classmethod
     def create(
@@ -670,6 +746,105 @@ class SyncLanguageServer:
         """
         return SyncLanguageServer(LanguageServer.create(config, logger, repository_root_path))
 
+    @classmethod
+    def create_persistent(
+        cls, config: MultilspyConfig, logger: MultilspyLogger, repository_root_path: str
+    ) -> "SyncLanguageServer":
+        """
+        Returns an already started SyncLanguageServer for the given configuration and repository, creating and
+        starting it on first use. The server, and the workspace index built by it, stays resident until
+        `close_persistent` is called for the same configuration and repository, or until interpreter exit.
+        This amortizes the server startup and indexing cost across callers, such as the tests in a test session,
+        that query the same repository.
+
+        Servers are shared between callers passing equal configurations (all MultilspyConfig fields are compared)
+        and the same repository. The logger is not part of this comparison: a server keeps logging to the logger
+        of the caller that started it.
+
+        `start_server` on the returned instance does not restart the server, so existing `with lsp.start_server():`
+        blocks work unchanged.
+
+        :param repository_root_path: The root path of the repository.
+        :param config: The Multilspy configuration.
+        :param logger: The logger to use, if this call starts the server.
+
+        :return SyncLanguageServer: A started, language specific SyncLanguageServer instance.
+        """
+        key = cls._persistent_key(config, repository_root_path)
+        with cls._persistent_servers_lock:
+            if key in cls._persistent_servers:
+                return cls._persistent_servers[key]
+            key_lock = cls._persistent_key_locks.setdefault(key, threading.Lock())
+
+        # Concurrent callers for the same key wait here for the first one to start the server,
+        # while callers for other keys proceed
+        with key_lock:
+            with cls._persistent_servers_lock:
+                if key in cls._persistent_servers:
+                    return cls._persistent_servers[key]
+
+            lsp = cls.create(config, logger, repository_root_path)
+            lsp._persistent_ctx = lsp.start_server()
+            lsp._persistent_ctx.__enter__()
+            lsp.persistent = True
+            atexit.register(lsp._stop_persistent)
+
+            with cls._persistent_servers_lock:
+                cls._persistent_servers[key] = lsp
+            return lsp
+
+    @classmethod
+    def close_persistent(cls, config: MultilspyConfig, repository_root_path: str) -> None:
+        """
+        Shuts down the server started by `create_persistent` for the given configuration and repository, if any.
+        A later `create_persistent` call for them starts a new server.
+
+        :param config: The Multilspy configuration passed to `create_persistent`.
+        :param repository_root_path: The root path of the repository passed to `create_persistent`.
+        """
+        key = cls._persistent_key(config, repository_root_path)
+        with cls._persistent_servers_lock:
+            key_lock = cls._persistent_key_locks.get(key)
+        if key_lock is None:
+            return
+
+        with key_lock:
+            with cls._persistent_servers_lock:
+                lsp = cls._persistent_servers.pop(key, None)
+            if lsp is not None:
+                atexit.unregister(lsp._stop_persistent)
+                lsp._stop_persistent()
+
+    @staticmethod
+    def _persistent_key(config: MultilspyConfig, repository_root_path: str) -> Tuple[tuple, str]:
+        """
+        Returns the key under which create_persistent shares a server
+        """
+        return (dataclasses.astuple(config), os.path.abspath(repository_root_path))
+
+    def _stop_persistent(self) -> None:
+        """
+        Shuts down a server started by create_persistent
+        """
+        ctx, self._persistent_ctx = self._persistent_ctx, None
+        self.persistent = False
+        if ctx is not None:
+            ctx.__exit__(None, None, None)
+
+    @classmethod
+    def _get_shared_loop(cls) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop on which all SyncLanguageServer instances run their language servers,
+        starting it in a daemon thread on first use. Reusing one loop avoids creating and tearing down
+        a loop and a thread for every `start_server`.
+        """
+        with cls._shared_loop_lock:
+            if cls._shared_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="multilspy-event-loop", daemon=True).start()
+                cls._shared_loop = loop
+        return cls._shared_loop
+
     @contextmanager
     def open_file(self, relative_file_path: str) -> Iterator[None]:
         """
@@ -720,15 +895,16 @@ class SyncLanguageServer:
 
         :return: None
         """
-        self.loop = asyncio.new_event_loop()
-        loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
-        loop_thread.start()
+        if self.persistent:
+            # The server was started by create_persistent and is shut down by close_persistent or at interpreter exit
+            yield self
+            return
+
+        self.loop = self._get_shared_loop()
         ctx = self.language_server.start_server()
         asyncio.run_coroutine_threadsafe(ctx.__aenter__(), loop=self.loop).result()
         yield self
         asyncio.run_coroutine_threadsafe(ctx.__aexit__(None, None, None), loop=self.loop).result()
-        self.loop.call_soon_threadsafe(self.loop.stop)
-        loop_thread.join()
 
     def request_definition(self, file_path: str, line: int, column: int) -> List[multilspy_types.Location]:
         """
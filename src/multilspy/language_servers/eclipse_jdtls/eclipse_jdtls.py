@@ -250,6 +250,7 @@ class EclipseJDTLS(LanguageServer):
 
         if not os.path.isabs(repository_absolute_path):
             repository_absolute_path = os.path.abspath(repository_absolute_path)
+        uri = pathlib.Path(repository_absolute_path).as_uri()
 
         assert d["processId"] == "os.getpid()"
         d["processId"] = os.getpid()
@@ -258,10 +259,10 @@ class EclipseJDTLS(LanguageServer):
         d["rootPath"] = repository_absolute_path
 
         assert d["rootUri"] == "pathlib.Path(repository_absolute_path).as_uri()"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = uri
 
         assert d["initializationOptions"]["workspaceFolders"] == "[pathlib.Path(repository_absolute_path).as_uri()]"
-        d["initializationOptions"]["workspaceFolders"] = [pathlib.Path(repository_absolute_path).as_uri()]
+        d["initializationOptions"]["workspaceFolders"] = [uri]
 
         assert (
             d["workspaceFolders"]
@@ -269,7 +270,7 @@ class EclipseJDTLS(LanguageServer):
         )
         d["workspaceFolders"] = [
             {
-                "uri": pathlib.Path(repository_absolute_path).as_uri(),
+                "uri": uri,
                 "name": os.path.basename(repository_absolute_path),
             }
         ]
@@ -350,18 +351,16 @@ class EclipseJDTLS(LanguageServer):
             return []
 
         async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
-
-        async def do_nothing(params):
-            return
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
 
         self.server.on_request("client/registerCapability", register_capability_handler)
         self.server.on_notification("language/status", lang_status_handler)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-        self.server.on_notification("language/actionableNotification", do_nothing)
+        self.server.on_notification("$/progress", None)
+        self.server.on_notification("textDocument/publishDiagnostics", None)
+        self.server.on_notification("language/actionableNotification", None)
 
         async with super().start_server():
             self.logger.log("Starting EclipseJDTLS server process", logging.INFO)
@@ -377,11 +376,12 @@ class EclipseJDTLS(LanguageServer):
             assert "completionProvider" not in init_response["capabilities"]
             assert "executeCommandProvider" not in init_response["capabilities"]
 
-            self.server.notify.initialized({})
+            with self.server.batch():
+                self.server.notify.initialized({})
 
-            self.server.notify.workspace_did_change_configuration(
-                {"settings": initialize_params["initializationOptions"]["settings"]}
-            )
+                self.server.notify.workspace_did_change_configuration(
+                    {"settings": initialize_params["initializationOptions"]["settings"]}
+                )
 
             await self.intellicode_enable_command_available.wait()
 
@@ -397,6 +397,7 @@ class EclipseJDTLS(LanguageServer):
 
             # TODO: Add comments about why we wait here, and how this can be optimized
             await self.service_ready_event.wait()
+            self.server_ready.set()
 
             yield self
 
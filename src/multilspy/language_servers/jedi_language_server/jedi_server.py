@@ -42,15 +42,17 @@ class JediServer(LanguageServer):
 
         del d["_description"]
 
+        uri = pathlib.Path(repository_absolute_path).as_uri()
+
         d["processId"] = os.getpid()
         assert d["rootPath"] == "$rootPath"
         d["rootPath"] = repository_absolute_path
 
         assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = uri
 
         assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["workspaceFolders"][0]["uri"] = uri
 
         assert d["workspaceFolders"][0]["name"] == "$name"
         d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
@@ -84,15 +86,16 @@ class JediServer(LanguageServer):
                 self.completions_available.set()
 
         async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
 
         self.server.on_request("client/registerCapability", do_nothing)
-        self.server.on_notification("language/status", do_nothing)
+        self.server.on_notification("language/status", None)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-        self.server.on_notification("language/actionableNotification", do_nothing)
+        self.server.on_notification("$/progress", None)
+        self.server.on_notification("textDocument/publishDiagnostics", None)
+        self.server.on_notification("language/actionableNotification", None)
         self.server.on_notification("experimental/serverStatus", check_experimental_status)
 
         async with super().start_server():
@@ -113,6 +116,7 @@ class JediServer(LanguageServer):
             }
 
             self.server.notify.initialized({})
+            self.server_ready.set()
 
             yield self
 
@@ -117,15 +117,17 @@ class OmniSharp(LanguageServer):
 
         del d["_description"]
 
+        uri = pathlib.Path(repository_absolute_path).as_uri()
+
         d["processId"] = os.getpid()
         assert d["rootPath"] == "$rootPath"
         d["rootPath"] = repository_absolute_path
 
         assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = uri
 
         assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["workspaceFolders"][0]["uri"] = uri
 
         assert d["workspaceFolders"][0]["name"] == "$name"
         d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
@@ -235,15 +237,13 @@ class OmniSharp(LanguageServer):
         async def execute_client_command_handler(params):
             return []
 
-        async def do_nothing(params):
-            return
-
         async def check_experimental_status(params):
             if params["quiescent"] == True:
                 self.server_ready.set()
 
         async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
 
         async def workspace_configuration_handler(params):
             # TODO: We do not know the appropriate way to handle this request. Should ideally contact the OmniSharp dev team
@@ -361,9 +361,9 @@ class OmniSharp(LanguageServer):
         self.server.on_notification("language/status", lang_status_handler)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-        self.server.on_notification("language/actionableNotification", do_nothing)
+        self.server.on_notification("$/progress", None)
+        self.server.on_notification("textDocument/publishDiagnostics", None)
+        self.server.on_notification("language/actionableNotification", None)
         self.server.on_notification("experimental/serverStatus", check_experimental_status)
         self.server.on_request("workspace/configuration", workspace_configuration_handler)
 
@@ -377,10 +377,12 @@ class OmniSharp(LanguageServer):
                 logging.INFO,
             )
             init_response = await self.server.send.initialize(initialize_params)
-            self.server.notify.initialized({})
             with open(os.path.join(os.path.dirname(__file__), "workspace_did_change_configuration.json"), "r") as f:
+                workspace_settings = json.load(f)
+            with self.server.batch():
+                self.server.notify.initialized({})
                 self.server.notify.workspace_did_change_configuration({
-                    "settings": json.load(f)
+                    "settings": workspace_settings
                 })
             assert "capabilities" in init_response
             if (
@@ -396,6 +398,7 @@ class OmniSharp(LanguageServer):
 
             await self.definition_available.wait()
             await self.references_available.wait()
+            self.server_ready.set()
 
             yield self
 
@@ -2,7 +2,6 @@
 Provides Rust specific instantiation of the LanguageServer class. Contains various configurations and settings specific to Rust.
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -37,7 +36,6 @@ class RustAnalyzer(LanguageServer):
             ProcessLaunchInfo(cmd=rustanalyzer_executable_path, cwd=repository_root_path),
             "rust",
         )
-        self.server_ready = asyncio.Event()
 
     def setup_runtime_dependencies(self, logger: MultilspyLogger, config: MultilspyConfig) -> str:
         """
@@ -87,15 +85,17 @@ class RustAnalyzer(LanguageServer):
 
         del d["_description"]
 
+        uri = pathlib.Path(repository_absolute_path).as_uri()
+
         d["processId"] = os.getpid()
         assert d["rootPath"] == "$rootPath"
         d["rootPath"] = repository_absolute_path
 
         assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["rootUri"] = uri
 
         assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
+        d["workspaceFolders"][0]["uri"] = uri
 
         assert d["workspaceFolders"][0]["name"] == "$name"
         d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
@@ -135,23 +135,21 @@ class RustAnalyzer(LanguageServer):
         async def execute_client_command_handler(params):
             return []
 
-        async def do_nothing(params):
-            return
-
         async def check_experimental_status(params):
             if params["quiescent"] == True:
                 self.server_ready.set()
 
         async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
 
         self.server.on_request("client/registerCapability", register_capability_handler)
         self.server.on_notification("language/status", lang_status_handler)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
-        self.server.on_notification("language/actionableNotification", do_nothing)
+        self.server.on_notification("$/progress", None)
+        self.server.on_notification("textDocument/publishDiagnostics", None)
+        self.server.on_notification("language/actionableNotification", None)
         self.server.on_notification("experimental/serverStatus", check_experimental_status)
 
         async with super().start_server():
@@ -174,8 +172,7 @@ class RustAnalyzer(LanguageServer):
             self.server.notify.initialized({})
             self.completions_available.set()
 
-            await self.server_ready.wait()
-
+            # server_ready is set once rust-analyzer reports quiescence; every request_* method waits for it
             yield self
 
             await self.server.shutdown()
@@ -3,23 +3,108 @@ Provides TypeScript specific instantiation of the LanguageServer class. Contains
 """
 
 import asyncio
+import copy
+import functools
 import json
 import shutil
 import logging
 import os
-import pwd
+import shlex
 import subprocess
 import pathlib
+import threading
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 from multilspy.multilspy_logger import MultilspyLogger
 from multilspy.language_server import LanguageServer
-from multilspy.lsp_protocol_handler.server import ProcessLaunchInfo
-from multilspy.lsp_protocol_handler.lsp_types import InitializeParams
+from multilspy.lsp_protocol_handler.server import ProcessLaunchInfo, RawJSON
 from multilspy.multilspy_config import MultilspyConfig
 from multilspy.multilspy_utils import PlatformUtils, PlatformId
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup, fall back to the standard library parser
+    orjson = None
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_TSSERVER_LS_DIR = os.path.join(_HERE, "static", "ts-lsp")
+_TSSERVER_EXECUTABLE_PATH = os.path.join(_TSSERVER_LS_DIR, "node_modules", ".bin", "typescript-language-server")
+_INIT_PARAMS_PATH = os.path.join(_HERE, "initialize_params.json")
+_RUNTIME_DEPS_PATH = os.path.join(_HERE, "runtime_dependencies.json")
+
+# Serializes installs of the runtime dependencies into _TSSERVER_LS_DIR
+_INSTALL_LOCK = threading.Lock()
+
+
+def _read_bytes(path: str) -> bytes:
+    """
+    Returns the contents of the given small file, read with a single unbuffered read.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _json_loads(data: bytes) -> dict:
+    """
+    Parses the given JSON document, using orjson when it is available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: dict) -> bytes:
+    """
+    Serializes the given object to compact JSON, using orjson when it is available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_runtime_deps() -> dict:
+    """
+    Returns the parsed runtime_dependencies.json. The file ships with the package, so it is parsed only once.
+    Callers must not mutate the returned dict; take a copy instead.
+    """
+    return _json_loads(_read_bytes(_RUNTIME_DEPS_PATH))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_init_params_template() -> bytes:
+    """
+    Returns the raw contents of initialize_params.json. The placeholders in it are substituted per repository
+    before parsing, see _serialize_initialize_params.
+    """
+    return _read_bytes(_INIT_PARAMS_PATH)
+
+
+@functools.lru_cache(maxsize=8)
+def _serialize_initialize_params(repository_absolute_path: str) -> bytes:
+    """
+    Returns the serialized initialize params for the given repository. The processId placeholder is left in place,
+    since the result is cached across processes forked from this one.
+    """
+    # Each placeholder is a unique JSON string in the template, so it is substituted on the raw bytes
+    # with the JSON encoding of its value, and the result is parsed once
+    uri = pathlib.Path(repository_absolute_path).as_uri()
+    raw = (
+        _load_init_params_template()
+        .replace(b'"$rootPath"', json.dumps(repository_absolute_path).encode())
+        .replace(b'"$rootUri"', json.dumps(uri).encode())
+        .replace(b'"$uri"', json.dumps(uri).encode())
+        .replace(b'"$name"', json.dumps(os.path.basename(repository_absolute_path)).encode())
+    )
+    d = _json_loads(raw)
+    del d["_description"]
+    return _json_dumps(d)
+
 
 class TypeScriptLanguageServer(LanguageServer):
     """
@@ -30,89 +115,85 @@ class TypeScriptLanguageServer(LanguageServer):
         """
         Creates a TypeScriptLanguageServer instance. This class is not meant to be instantiated directly. Use LanguageServer.create() instead.
         """
-        ts_lsp_executable_path = self.setup_runtime_dependencies(logger, config)
+        self.config = config
+        self.tsserver_ls_dir = _TSSERVER_LS_DIR
         super().__init__(
             config,
             logger,
             repository_root_path,
-            ProcessLaunchInfo(cmd=ts_lsp_executable_path, cwd=repository_root_path),
+            ProcessLaunchInfo(cmd=f"{_TSSERVER_EXECUTABLE_PATH} --stdio", cwd=repository_root_path),
             "typescript",
         )
-        self.server_ready = asyncio.Event()
 
     def setup_runtime_dependencies(self, logger: MultilspyLogger, config: MultilspyConfig) -> str:
         """
         Setup runtime dependencies for TypeScript Language Server.
         """
-        platform_id = PlatformUtils.get_platform_id()
-
-        valid_platforms = [
-            PlatformId.LINUX_x64, 
-            PlatformId.LINUX_arm64,
-            PlatformId.OSX, 
-            PlatformId.OSX_x64,
-            PlatformId.OSX_arm64,
-            PlatformId.WIN_x64, 
-            PlatformId.WIN_arm64, 
-        ] 
-        assert platform_id in valid_platforms, f"Platform {platform_id} is not supported for multilspy javascript/typescript at the moment"
-
-        with open(os.path.join(os.path.dirname(__file__), "runtime_dependencies.json"), "r") as f:
-            d = json.load(f)
+        tsserver_ls_dir = self.tsserver_ls_dir
+        tsserver_executable_path = _TSSERVER_EXECUTABLE_PATH
+
+        # A sentinel is written after a successful install, so warm starts skip all the probing below
+        sentinel_path = os.path.join(tsserver_ls_dir, ".multilspy_ready")
+        if os.path.exists(sentinel_path):
+            return f"{tsserver_executable_path} --stdio"
+
+        # Installs run from start_server on executor threads, so concurrent starts must not run npm in the same
+        # prefix directory at once
+        with _INSTALL_LOCK:
+            # Another server may have completed the install while this one waited for the lock
+            if os.path.exists(sentinel_path):
+                return f"{tsserver_executable_path} --stdio"
+
+            platform_id = PlatformUtils.get_platform_id()
+
+            valid_platforms = [
+                PlatformId.LINUX_x64, 
+                PlatformId.LINUX_arm64,
+                PlatformId.OSX, 
+                PlatformId.OSX_x64,
+                PlatformId.OSX_arm64,
+                PlatformId.WIN_x64, 
+                PlatformId.WIN_arm64, 
+            ] 
+            assert platform_id in valid_platforms, f"Platform {platform_id} is not supported for multilspy javascript/typescript at the moment"
+
+            d = copy.deepcopy(_load_runtime_deps())
             del d["_description"]
 
-        runtime_dependencies = d.get("runtimeDependencies", [])
-        tsserver_ls_dir = os.path.join(os.path.dirname(__file__), "static", "ts-lsp")
-        tsserver_executable_path = os.path.join(tsserver_ls_dir, "typescript-language-server")
+            runtime_dependencies = d.get("runtimeDependencies", [])
 
-        # Verify both node and npm are installed
-        is_node_installed = shutil.which('node') is not None
-        assert is_node_installed, "node is not installed or isn't in PATH. Please install NodeJS and try again."
-        is_npm_installed = shutil.which('npm') is not None
-        assert is_npm_installed, "npm is not installed or isn't in PATH. Please install npm and try again."
+            # Verify both node and npm are installed
+            is_node_installed = shutil.which('node') is not None
+            assert is_node_installed, "node is not installed or isn't in PATH. Please install NodeJS and try again."
+            is_npm_installed = shutil.which('npm') is not None
+            assert is_npm_installed, "npm is not installed or isn't in PATH. Please install npm and try again."
 
-        # Install typescript and typescript-language-server if not already installed, as a non-root user
-        if not os.path.exists(tsserver_ls_dir):
+            # Install typescript and typescript-language-server as the current user. An interrupted install
+            # leaves no sentinel behind, so it is retried on the next start.
             os.makedirs(tsserver_ls_dir, exist_ok=True)
             for dependency in runtime_dependencies:
-                user = pwd.getpwuid(os.getuid()).pw_name
+                args = shlex.split(dependency["command"])
+                # Resolve the executable through PATH (and PATHEXT on Windows, where npm is npm.cmd), since no shell is involved
+                args[0] = shutil.which(args[0]) or args[0]
                 subprocess.run(
-                    dependency["command"], 
-                    shell=True, 
-                    check=True, 
-                    user=user, 
+                    args,
+                    check=True,
                     cwd=tsserver_ls_dir,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
                 )
-        
-        tsserver_executable_path = os.path.join(tsserver_ls_dir, "node_modules", ".bin", "typescript-language-server")
-        assert os.path.exists(tsserver_executable_path), "typescript-language-server executable not found. Please install typescript-language-server and try again."
-        return f"{tsserver_executable_path} --stdio"
 
-    def _get_initialize_params(self, repository_absolute_path: str) -> InitializeParams:
+            assert os.path.exists(tsserver_executable_path), "typescript-language-server executable not found. Please install typescript-language-server and try again."
+            pathlib.Path(sentinel_path).touch()
+            return f"{tsserver_executable_path} --stdio"
+
+    def _get_serialized_initialize_params(self, repository_absolute_path: str) -> bytes:
         """
-        Returns the initialize params for the TypeScript Language Server.
+        Returns the initialize params for the TypeScript Language Server, serialized to JSON.
         """
-        with open(os.path.join(os.path.dirname(__file__), "initialize_params.json"), "r") as f:
-            d = json.load(f)
-
-        del d["_description"]
-
-        d["processId"] = os.getpid()
-        assert d["rootPath"] == "$rootPath"
-        d["rootPath"] = repository_absolute_path
-
-        assert d["rootUri"] == "$rootUri"
-        d["rootUri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["uri"] == "$uri"
-        d["workspaceFolders"][0]["uri"] = pathlib.Path(repository_absolute_path).as_uri()
-
-        assert d["workspaceFolders"][0]["name"] == "$name"
-        d["workspaceFolders"][0]["name"] = os.path.basename(repository_absolute_path)
-
-        return d
+        return _serialize_initialize_params(repository_absolute_path).replace(
+            b'"os.getpid()"', str(os.getpid()).encode(), 1
+        )
     
     @asynccontextmanager
     async def start_server(self) -> AsyncIterator["TypeScriptLanguageServer"]:
@@ -142,22 +223,26 @@ class TypeScriptLanguageServer(LanguageServer):
         async def execute_client_command_handler(params):
             return []
 
-        async def do_nothing(params):
-            return
-
         async def window_log_message(msg):
-            self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
+            if self.logger.is_enabled_for(logging.INFO):
+                self.logger.log(f"LSP: window/logMessage: {msg}", logging.INFO)
 
         self.server.on_request("client/registerCapability", register_capability_handler)
         self.server.on_notification("window/logMessage", window_log_message)
         self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
+        self.server.on_notification("$/progress", None)
+        self.server.on_notification("textDocument/publishDiagnostics", None)
 
         async with super().start_server():
+            # Runtime dependencies are installed here rather than in __init__, so that constructing
+            # the object does not block on npm
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.setup_runtime_dependencies, self.logger, self.config
+            )
+
             self.logger.log("Starting TypeScript server process", logging.INFO)
             await self.server.start()
-            initialize_params = self._get_initialize_params(self.repository_root_path)
+            initialize_params = RawJSON(self._get_serialized_initialize_params(self.repository_root_path))
 
             self.logger.log(
                 "Sending initialize request from LSP client to LSP server and awaiting response",
@@ -178,7 +263,6 @@ class TypeScriptLanguageServer(LanguageServer):
 
             # TypeScript server is typically ready immediately after initialization
             self.server_ready.set()
-            await self.server_ready.wait()
 
             yield self
 
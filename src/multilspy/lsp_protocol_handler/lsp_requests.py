@@ -29,9 +29,13 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import List, Union
+from typing import TYPE_CHECKING, List, Union
 from multilspy.lsp_protocol_handler import lsp_types
 
+if TYPE_CHECKING:
+    # server imports this module, so RawJSON is only imported for type checking
+    from multilspy.lsp_protocol_handler.server import RawJSON
+
 class LspRequest:
     def __init__(self, send_request):
         self.send_request = send_request
@@ -258,11 +262,12 @@ class LspRequest:
         return await self.send_request("workspace/diagnostic", params)
 
     async def initialize(
-        self, params: lsp_types.InitializeParams
+        self, params: Union[lsp_types.InitializeParams, "RawJSON"]
     ) -> "lsp_types.InitializeResult":
         """The initialize request is sent from the client to the server.
         It is sent once as the request after starting up the server.
-        The requests parameter is of type {@link InitializeParams}
+        The requests parameter is of type {@link InitializeParams}, or a RawJSON
+        wrapping InitializeParams that are already serialized,
         the response if of type {@link InitializeResult} of a Thenable that
         resolves to such."""
         return await self.send_request("initialize", params)
@@ -32,7 +32,8 @@ import asyncio
 import dataclasses
 import json
 import os
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from .lsp_requests import LspNotification, LspRequest
 from .lsp_types import ErrorCodes
@@ -95,8 +96,32 @@ class StopLoopException(Exception):
     pass
 
 
+class RawJSON:
+    """
+    Wraps params that are already serialized to JSON, so that they are written to the server as is,
+    without a round-trip through json.dumps.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.data!r})"
+
+    def __str__(self) -> str:
+        return self.data.decode(ENCODING)
+
+
 def create_message(payload: PayloadLike):
-    body = json.dumps(payload, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
+    params = payload.get("params") if isinstance(payload, dict) else None
+    if isinstance(params, RawJSON):
+        envelope = {k: v for k, v in payload.items() if k != "params"}
+        head = json.dumps(envelope, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
+        body = head[:-1] + b',"params":' + params.data + b"}"
+    else:
+        body = json.dumps(payload, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
     return (
         f"Content-Length: {len(body)}\r\n".encode(ENCODING),
         "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n".encode(ENCODING),
@@ -171,6 +196,8 @@ class LanguageServerHandler:
             the asynchronous tasks created by the handler.
         task_counter: An integer that represents the next available task id for the handler.
         loop: An asyncio.AbstractEventLoop object that represents the event loop used by the handler.
+        _batched_messages: A list of encoded messages buffered by an active batch() block,
+            or None when no batch is active.
     """
 
     def __init__(self, process_launch_info: ProcessLaunchInfo, logger=None) -> None:
@@ -195,6 +222,7 @@ class LanguageServerHandler:
         self.tasks = {}
         self.task_counter = 0
         self.loop = None
+        self._batched_messages: Optional[List[bytes]] = None
 
     async def start(self) -> None:
         """
@@ -373,6 +401,33 @@ class LanguageServerHandler:
             raise request.error
         return request.result
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Buffer the notifications sent within the block and write them to the server together,
+        in a single write, when the block exits. A request sent within the block first flushes
+        the buffered notifications, so the order of messages is preserved. Nested blocks join the
+        outermost batch, which flushes all buffered notifications when it exits.
+        """
+        if self._batched_messages is not None:
+            yield
+            return
+        self._batched_messages = []
+        try:
+            yield
+        finally:
+            self._flush_batched_messages()
+            self._batched_messages = None
+
+    def _flush_batched_messages(self) -> None:
+        """
+        Write the messages buffered by an active batch to the server
+        """
+        if self._batched_messages and self.process and self.process.stdin:
+            self.process.stdin.writelines(self._batched_messages)
+        if self._batched_messages is not None:
+            self._batched_messages.clear()
+
     def _send_payload_sync(self, payload: StringDict) -> None:
         """
         Send the payload to the server by writing to its stdin synchronously
@@ -382,6 +437,9 @@ class LanguageServerHandler:
         msg = create_message(payload)
         if self.logger:
             self.logger("client", "server", payload)
+        if self._batched_messages is not None:
+            self._batched_messages.extend(msg)
+            return
         self.process.stdin.writelines(msg)
 
     async def _send_payload(self, payload: StringDict) -> None:
@@ -393,6 +451,7 @@ class LanguageServerHandler:
         msg = create_message(payload)
         if self.logger:
             self.logger("client", "server", payload)
+        self._flush_batched_messages()
         self.process.stdin.writelines(msg)
         await self.process.stdin.drain()
 
@@ -404,7 +463,8 @@ class LanguageServerHandler:
 
     def on_notification(self, method: str, cb) -> None:
         """
-        Register the callback function to handle notifications from the server to the client for the given method
+        Register the callback function to handle notifications from the server to the client for the given method.
+        Passing None as the callback drops notifications for the method without invoking any coroutine.
         """
         self.on_notification_handlers[method] = cb
 
@@ -452,7 +512,8 @@ class LanguageServerHandler:
         params = response.get("params")
         handler = self.on_notification_handlers.get(method)
         if not handler:
-            self._log(f"unhandled {method}")
+            if method not in self.on_notification_handlers:
+                self._log(f"unhandled {method}")
             return
         try:
             await handler(params)
@@ -27,10 +27,19 @@ class MultilspyLogger:
         self.logger = logging.getLogger("multilspy")
         self.logger.setLevel(logging.INFO)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Returns whether messages of the given level would be emitted by the logger
+        """
+        return self.logger.isEnabledFor(level)
+
     def log(self, debug_message: str, level: int, sanitized_error_message: str = "") -> None:
         """
         Log the debug and santized messages using the logger
         """
+        # Skip collecting the caller details and building the log line for messages that would be dropped
+        if not self.logger.isEnabledFor(level):
+            return
 
         debug_message = debug_message.replace("'", '"').replace("\n", " ")
         sanitized_error_message = sanitized_error_message.replace("'", '"').replace("\n", " ")
@@ -0,0 +1,124 @@
+"""
+This file contains tests for the JSON-RPC client in multilspy.lsp_protocol_handler.server, that do not need a language server
+"""
+
+import json
+from typing import List
+
+from multilspy.lsp_protocol_handler.server import (
+    LanguageServerHandler,
+    ProcessLaunchInfo,
+    RawJSON,
+    create_message,
+    make_request,
+)
+
+
+class FakeStdin:
+    """
+    Records the writes made to the stdin of the language server process
+    """
+
+    def __init__(self) -> None:
+        self.writes: List[bytes] = []
+
+    def writelines(self, data) -> None:
+        self.writes.append(b"".join(data))
+
+    async def drain(self) -> None:
+        pass
+
+
+class FakeProcess:
+    def __init__(self) -> None:
+        self.stdin = FakeStdin()
+
+
+def parse_frames(data: bytes) -> List[dict]:
+    """
+    Splits the given bytes into LSP frames and returns their parsed bodies, checking the Content-Length of each
+    """
+    bodies = []
+    while data:
+        header, data = data.split(b"\r\n\r\n", 1)
+        content_length = int(header.split(b"\r\n")[0][len(b"Content-Length: "):])
+        body, data = data[:content_length], data[content_length:]
+        bodies.append(json.loads(body))
+    return bodies
+
+
+def create_handler() -> LanguageServerHandler:
+    handler = LanguageServerHandler(ProcessLaunchInfo(cmd="unused"))
+    handler.process = FakeProcess()
+    return handler
+
+
+def test_batch_writes_notifications_in_a_single_write() -> None:
+    """
+    Test that notifications sent within a batch are written together and in order when the batch exits
+    """
+    handler = create_handler()
+    with handler.batch():
+        handler.notify.initialized({})
+        handler.notify.exit()
+        assert handler.process.stdin.writes == []
+
+    assert len(handler.process.stdin.writes) == 1
+    assert [frame["method"] for frame in parse_frames(handler.process.stdin.writes[0])] == ["initialized", "exit"]
+
+    handler.notify.exit()
+    assert len(handler.process.stdin.writes) == 2
+
+
+def test_batch_nested_blocks_join_the_outermost_batch() -> None:
+    """
+    Test that a nested batch does not drop or flush the notifications buffered by the outer batch
+    """
+    handler = create_handler()
+    with handler.batch():
+        handler.notify.initialized({})
+        with handler.batch():
+            handler.notify.exit()
+        assert handler.process.stdin.writes == []
+
+    assert len(handler.process.stdin.writes) == 1
+    assert [frame["method"] for frame in parse_frames(handler.process.stdin.writes[0])] == ["initialized", "exit"]
+
+
+async def test_batch_request_flushes_buffered_notifications_first() -> None:
+    """
+    Test that a request sent within a batch is written after the notifications buffered before it
+    """
+    handler = create_handler()
+    with handler.batch():
+        handler.notify.initialized({})
+        await handler._send_payload({"jsonrpc": "2.0", "method": "shutdown", "id": 1, "params": None})
+        handler.notify.exit()
+
+    frames = parse_frames(b"".join(handler.process.stdin.writes))
+    assert [frame["method"] for frame in frames] == ["initialized", "shutdown", "exit"]
+
+
+def test_create_message_splices_raw_json_params() -> None:
+    """
+    Test that a request with RawJSON params is framed as valid JSON with a matching Content-Length
+    """
+    params = {"processId": 1234, "rootPath": 'C:\\repo "quoted"', "rootUri": "file:///r%C3%A9po", "name": "r\u00e9po"}
+    raw = json.dumps(params, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    header, content_type, body = create_message(make_request("initialize", 7, RawJSON(raw)))
+
+    assert header == f"Content-Length: {len(body)}\r\n".encode("utf-8")
+    assert content_type == b"Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n"
+    assert json.loads(body) == {"jsonrpc": "2.0", "method": "initialize", "id": 7, "params": params}
+    assert parse_frames(header + content_type + body) == [json.loads(body)]
+    assert body == create_message(make_request("initialize", 7, params))[2]
+
+
+def test_raw_json_repr_and_str() -> None:
+    """
+    Test that RawJSON is distinguishable from a plain value in reprs, and that str gives the JSON text
+    """
+    raw = RawJSON(b'{"name":"r\xc3\xa9po"}')
+    assert repr(raw) == "RawJSON(b'{\"name\":\"r\\xc3\\xa9po\"}')"
+    assert str(raw) == '{"name":"r\u00e9po"}'
@@ -0,0 +1,77 @@
+"""
+This file contains tests for the persistent servers returned by SyncLanguageServer.create_persistent
+"""
+
+import threading
+
+from multilspy import SyncLanguageServer
+from multilspy.multilspy_config import Language, MultilspyConfig
+from multilspy.multilspy_logger import MultilspyLogger
+
+
+def test_sync_multilspy_create_persistent_reuses_started_server(tmp_path) -> None:
+    """
+    Test that create_persistent starts one server per (configuration, repository) and returns it on every call
+    """
+    (tmp_path / "main.py").write_text("def foo():\n    return 1\n\nfoo()\n")
+    config = MultilspyConfig.from_dict({"code_language": Language.PYTHON})
+    logger = MultilspyLogger()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(SyncLanguageServer.create_persistent(config, logger, str(tmp_path)))
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    lsp = SyncLanguageServer.create_persistent(config, logger, str(tmp_path))
+    assert len(results) == 2
+    assert results[0] is lsp
+    assert results[1] is lsp
+    assert lsp.persistent
+    assert lsp.language_server.server_started
+
+    # start_server on a persistent server does not restart it
+    with lsp.start_server():
+        result = lsp.request_definition("main.py", 3, 0)
+    assert lsp.language_server.server_started
+    assert len(result) == 1
+    assert result[0]["relativePath"] == "main.py"
+    assert result[0]["range"]["start"] == {"line": 0, "character": 4}
+
+    SyncLanguageServer.close_persistent(config, str(tmp_path))
+
+
+def test_sync_multilspy_close_persistent_evicts_server(tmp_path) -> None:
+    """
+    Test that servers for different configurations are separate, and that close_persistent shuts down only its own
+    """
+    (tmp_path / "main.py").write_text("def foo():\n    return 1\n\nfoo()\n")
+    config = MultilspyConfig.from_dict({"code_language": Language.PYTHON})
+    traced_config = MultilspyConfig.from_dict({"code_language": Language.PYTHON, "trace_lsp_communication": True})
+    logger = MultilspyLogger()
+
+    lsp = SyncLanguageServer.create_persistent(config, logger, str(tmp_path))
+    traced_lsp = SyncLanguageServer.create_persistent(traced_config, logger, str(tmp_path))
+    assert lsp is not traced_lsp
+
+    SyncLanguageServer.close_persistent(config, str(tmp_path))
+    assert not lsp.persistent
+    assert not lsp.language_server.server_started
+    assert traced_lsp.language_server.server_started
+    assert SyncLanguageServer.create_persistent(traced_config, logger, str(tmp_path)) is traced_lsp
+
+    new_lsp = SyncLanguageServer.create_persistent(config, logger, str(tmp_path))
+    assert new_lsp is not lsp
+    assert new_lsp.language_server.server_started
+
+    SyncLanguageServer.close_persistent(config, str(tmp_path))
+    SyncLanguageServer.close_persistent(traced_config, str(tmp_path))
+    # Closing a server that is not running is a no-op
+    SyncLanguageServer.close_persistent(config, str(tmp_path))
+    assert not traced_lsp.language_server.server_started
@@ -0,0 +1,38 @@
+"""
+This file contains tests for ThreadSafeEvent, used by LanguageServer to signal that the server is ready
+"""
+
+import asyncio
+import threading
+
+from multilspy.language_server import ThreadSafeEvent
+
+
+async def test_thread_safe_event_set_from_another_thread_wakes_waiter() -> None:
+    """
+    Test that set() called from a thread other than the bound loop's wakes a pending wait()
+    """
+    event = ThreadSafeEvent()
+    event.bind(asyncio.get_running_loop())
+    assert not event.is_set()
+
+    threading.Timer(0.05, event.set).start()
+    await asyncio.wait_for(event.wait(), timeout=5)
+    assert event.is_set()
+
+
+async def test_thread_safe_event_set_before_bind_applies_to_next_bind_only() -> None:
+    """
+    Test that set() before bind() is applied by the next bind(), and that a later bind() starts unset
+    """
+    event = ThreadSafeEvent()
+    event.set()
+    assert event.is_set()
+
+    event.bind(asyncio.get_running_loop())
+    await asyncio.wait_for(event.wait(), timeout=5)
+    assert event.is_set()
+
+    # Rebinding, as on a restart of the same LanguageServer, must not report ready before set() is called again
+    event.bind(asyncio.get_running_loop())
+    assert not event.is_set()